@@ -10,13 +10,19 @@ from tadl.types import TKey, TElt, TSelf
 BatchLoadFn = Callable[[TSelf, list[TKey]], Awaitable[list[TElt]]]
 
 
-def batch_loader() -> (
+def batch_loader(
+    *,
+    max_batch_size: int | None = None,
+) -> (
     Callable[
         [BatchLoadFn[TSelf, TKey, TElt]], LazyInitDescriptor[BatchLoader[TKey, TElt]]
     ]
 ):
     """
     A method decorator that transforms a function into a BatchLoader.
+
+    ``max_batch_size`` limits the number of keys passed to a single call of the
+    load function (by default, batches are unbounded).
     """
 
     def decorator(
@@ -25,6 +31,7 @@ def batch_loader() -> (
         interface = LazyInitDescriptor(
             lambda instance: BatchLoader[TKey, TElt](
                 lambda keys: fn(cast(TSelf, instance), keys),
+                max_batch_size=max_batch_size,
             )
         )
         return interface
@@ -40,13 +47,17 @@ class BatchLoader(Generic[TKey, TElt]):
     provided by TADL.
     """
 
+    __slots__ = ("__load_fn", "__dl")
+
     def __init__(
         self,
         load_fn: Callable[[list[TKey]], Awaitable[list[TElt]]],
+        *,
+        max_batch_size: int | None = None,
     ) -> None:
         self.__load_fn = load_fn
         self.__dl: strawberry.dataloader.DataLoader[TKey, TElt] = (
-            strawberry.dataloader.DataLoader(self.__load)
+            strawberry.dataloader.DataLoader(self.__load, max_batch_size=max_batch_size)
         )
 
     async def __load(self, keys: list[TKey]) -> list[TElt]:
@@ -17,6 +17,8 @@ class LazyInitDescriptor(Generic[T]):
     https://docs.python.org/3/howto/descriptor.html
     """
 
+    __slots__ = ("__fn", "__name")
+
     def __init__(self, fn: Callable[[TSelf], T]) -> None:
         self.__fn = fn
 
@@ -24,6 +26,13 @@ class LazyInitDescriptor(Generic[T]):
         # __set_name__ is invoked at the end of the class definition body.
         self.__name = name
 
+    @property
+    def name(self) -> str:
+        """
+        The name of the attribute that this descriptor is assigned to.
+        """
+        return self.__name
+
     def __get__(self, instance: TSelf, owner: type) -> T:
         """
         On the first property access, we construct the desired object and then
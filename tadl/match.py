@@ -28,8 +28,17 @@ def match_array(
     # Output: [None, 4, 6]
     ```
     """
-    items = {key(value): value for value in values}
-    return [items.get(key) for key in keys]
+    value_keys = list(map(key, values))
+    key_list = list(keys)
+    if value_keys == key_list and len(set(key_list)) == len(key_list):
+        # Fast path: the values are already in the same order as the (unique)
+        # keys, which is common for data sources that return results in request
+        # order, so there's no need to build the lookup table. With repeated
+        # keys, the last value for each key wins (as it does in the lookup
+        # table), so we fall through.
+        return list(values)
+    items = dict(zip(value_keys, values))
+    return list(map(items.get, keys))
 
 
 def group_array(
@@ -44,7 +53,8 @@ def group_array(
     the input keys array.
 
     The values are sorted within each group by the sort function for
-    deterministic ordering.
+    deterministic ordering. The key and sort functions are each called exactly
+    once per value (never during the sort itself).
 
     # Example
     ```python
@@ -60,9 +70,13 @@ def group_array(
     ```
     """
     groups: dict[TKey, list[TElt]] = {}
+    groups_get = groups.get
     for value in values:
-        group = groups.setdefault(key(value), [])
+        k = key(value)
+        group = groups_get(k)
+        if group is None:
+            group = groups[k] = []
         group.append(value)
     for group in groups.values():
         group.sort(key=sort)
-    return [groups.get(key) or [] for key in keys]
+    return [groups_get(k) or [] for k in keys]
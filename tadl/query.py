@@ -6,6 +6,7 @@ from tadl.descriptor import LazyInitDescriptor
 from tadl.query_batch import QueryInstanceBatchLoader
 from tadl.query_group import QueryInstanceGroupLoader
 from tadl.query_interface import QueryInterface
+from tadl.specialize import specialize_callable
 from tadl.types import TElt, TSelf, TKey, Scalar
 
 TParamSpec = ParamSpec("TParamSpec")
@@ -36,6 +37,8 @@ class Query(Generic[TParamSpec, TElt]):
     interfaces to the query.
     """
 
+    __slots__ = ("__query_fn", "__interfaces", "__name")
+
     def __init__(self, query_fn: TQueryMethod[TSelf, TParamSpec, TElt]) -> None:
         self.__query_fn = query_fn
         self.__interfaces: list[LazyInitDescriptor[QueryInterface[TElt]]] = []
@@ -50,31 +53,40 @@ class Query(Generic[TParamSpec, TElt]):
             raise ValueError(
                 "QueryLoaderDescriptor must be accessed through an instance."
             )
-        if not hasattr(instance, "__query_loader__"):
-            setattr(instance, "__query_loader__", {})  # type: ignore[misc]
-        loader_map = cast(
-            dict[str, QueryInstance[TSelf, TParamSpec, TElt]],
-            instance.__query_loader__,  # type: ignore[attr-defined]
+        # Like ``LazyInitDescriptor``, we store the QueryInstance on the
+        # instance under the same name as the descriptor so that subsequent
+        # accesses find the instance attribute and bypass ``__get__`` entirely.
+        # The interfaces are looked up through the instance (rather than by
+        # invoking their descriptors directly) so that any interface that has
+        # already been initialized on the instance is reused instead of being
+        # replaced by a new (empty) loader.
+        query_instance: QueryInstance[TSelf, TParamSpec, TElt] = QueryInstance(
+            instance,
+            self.__query_fn,
+            [
+                cast(QueryInterface[TElt], getattr(instance, interface.name))
+                for interface in self.__interfaces
+            ],
         )
-        if self.__name not in loader_map:
-            loader_map[self.__name] = QueryInstance(
-                instance,
-                self.__query_fn,
-                [interface.__get__(instance, owner) for interface in self.__interfaces],
-            )
-        return loader_map[self.__name]
+        setattr(instance, self.__name, query_instance)
+        return query_instance
 
     def batch_interface(
         self,
         *,
         key: Callable[[TElt], TKey],
+        max_batch_size: int | None = None,
     ) -> Callable[
         [TLoadMethod[TSelf, TKey, TElt]],
         LazyInitDescriptor[QueryInstanceBatchLoader[TKey, TElt]],
     ]:
         """
         Create a new batch interface for the query.
+
+        ``max_batch_size`` limits the number of keys passed to a single call of
+        the load function (by default, batches are unbounded).
         """
+        key = specialize_callable(key)
 
         def decorator(
             fn: TLoadMethod[TSelf, TKey, TElt],
@@ -83,6 +95,7 @@ class Query(Generic[TParamSpec, TElt]):
                 lambda instance: QueryInstanceBatchLoader[TKey, TElt](
                     lambda keys: fn(cast(TSelf, instance), keys),
                     key,
+                    max_batch_size=max_batch_size,
                 )
             )
             self.__interfaces.append(
@@ -97,20 +110,29 @@ class Query(Generic[TParamSpec, TElt]):
         *,
         key: Callable[[TElt], TKey],
         sort: Callable[[TElt], Scalar],
+        max_batch_size: int | None = None,
     ) -> Callable[
         [TLoadMethod[TSelf, TKey, TElt]],
         LazyInitDescriptor[QueryInstanceGroupLoader[TKey, TElt]],
     ]:
         """
         Create a new group interface for the query.
+
+        ``max_batch_size`` limits the number of keys passed to a single call of
+        the load function (by default, batches are unbounded).
         """
+        key = specialize_callable(key)
+        sort = specialize_callable(sort)
 
         def decorator(
             fn: Callable[[TSelf, list[TKey]], Awaitable[list[TElt]]],
         ) -> LazyInitDescriptor[QueryInstanceGroupLoader[TKey, TElt]]:
             interface = LazyInitDescriptor(
                 lambda instance: QueryInstanceGroupLoader[TKey, TElt](
-                    lambda keys: fn(cast(TSelf, instance), keys), key, sort
+                    lambda keys: fn(cast(TSelf, instance), keys),
+                    key,
+                    sort,
+                    max_batch_size=max_batch_size,
                 )
             )
             self.__interfaces.append(
@@ -122,6 +144,8 @@ class Query(Generic[TParamSpec, TElt]):
 
 
 class QueryInstance(Generic[TSelf, TParamSpec, TElt]):
+    __slots__ = ("__instance", "__query_fn", "__prime_many_fns")
+
     def __init__(
         self,
         instance: TSelf,
@@ -130,17 +154,21 @@ class QueryInstance(Generic[TSelf, TParamSpec, TElt]):
     ) -> None:
         self.__instance = instance
         self.__query_fn = query_fn
-        self.__interfaces = interfaces
+        # The interfaces are fixed for the lifetime of the QueryInstance, so we
+        # bind their ``prime_many`` methods once up front.
+        self.__prime_many_fns: tuple[Callable[[list[TElt]], None], ...] = tuple(
+            interface.prime_many for interface in interfaces
+        )
 
     async def query(
         self, *args: TParamSpec.args, **kwargs: TParamSpec.kwargs
     ) -> list[TElt]:
         elts = await self.__query_fn(self.__instance, *args, **kwargs)
-        for interface in self.__interfaces:
-            interface.prime_many(elts)
+        for prime_many in self.__prime_many_fns:
+            prime_many(elts)
         return elts
 
-    async def __call__(
+    def __call__(
         self, *args: TParamSpec.args, **kwargs: TParamSpec.kwargs
-    ) -> list[TElt]:
-        return await self.query(*args, **kwargs)
+    ) -> Awaitable[list[TElt]]:
+        return self.query(*args, **kwargs)
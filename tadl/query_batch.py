@@ -13,40 +13,70 @@ class QueryInstanceBatchLoader(QueryInterface[TElt], Generic[TKey, TElt]):
     a list of keys and one item for each key.
     """
 
+    __slots__ = ("__load_fn", "__key_fn", "__dl", "__cache", "__pending")
+
     def __init__(
         self,
         load_fn: Callable[[list[TKey]], Awaitable[list[TElt]]],
         key_fn: Callable[[TElt], TKey],
+        *,
+        max_batch_size: int | None = None,
     ) -> None:
         self.__load_fn = load_fn
         self.__key_fn = key_fn
         self.__dl: strawberry.dataloader.DataLoader[TKey, TElt | None] = (
-            strawberry.dataloader.DataLoader(self.__load)
+            strawberry.dataloader.DataLoader(self.__load, max_batch_size=max_batch_size)
         )
+        # A synchronous mirror of the values resolved by the DataLoader (either
+        # by priming or by loading). Cache hits are served directly from here
+        # so that they don't have to go through the DataLoader's futures (and
+        # the event loop).
+        self.__cache: dict[TKey, TElt | None] = {}
+        # Keys that have been requested from the DataLoader but whose values
+        # haven't been mirrored into the cache yet. The DataLoader already has
+        # an entry for these keys, so priming them must not add a (possibly
+        # different) value to the mirror; instead, the value is mirrored from
+        # the DataLoader once the load resolves.
+        self.__pending: set[TKey] = set()
 
     async def __load(self, keys: list[TKey]) -> list[TElt | None]:
         elts = await self.__load_fn(keys)
         return match_array(keys, elts, key=self.__key_fn)
 
-    async def __call__(self, key: TKey) -> TElt | None:
+    def __call__(self, key: TKey) -> Awaitable[TElt | None]:
         """
         Load a single element by key.
 
         This is a convenience method that wraps the `load` method.
         """
-        return await self.__dl.load(key)
+        return self.load(key)
 
     def prime_many(self, elts: list[TElt]) -> None:
         """
         Prime the cache with the given elements.
         """
-        self.__dl.prime_many({self.__key_fn(elt): elt for elt in elts})
+        data = dict(zip(map(self.__key_fn, elts), elts))
+        self.__dl.prime_many(data)
+        # Like the DataLoader, priming never overwrites an existing value
+        # (including the value of a load that is still pending).
+        cache = self.__cache
+        pending = self.__pending
+        for key, elt in data.items():
+            if key not in pending:
+                cache.setdefault(key, elt)
 
     async def load(self, key: TKey) -> TElt | None:
         """
         Load a single element by key.
         """
-        return await self.__dl.load(key)
+        cache = self.__cache
+        if key in cache:
+            return cache[key]
+        self.__pending.add(key)
+        elt = await self.__dl.load(key)
+        cache[key] = elt
+        self.__pending.discard(key)
+        return elt
 
     async def load_many(self, keys: list[TKey]) -> list[TElt | None]:
         """
@@ -55,7 +85,14 @@ class QueryInstanceBatchLoader(QueryInterface[TElt], Generic[TKey, TElt]):
         The resulting list will have the same order as the input list (including
         ``None`` values for keys that were not found).
         """
-        return await self.__dl.load_many(keys)
+        cache = self.__cache
+        misses = [key for key in keys if key not in cache]
+        if not misses:
+            return [cache[key] for key in keys]
+        self.__pending.update(misses)
+        cache.update(zip(misses, await self.__dl.load_many(misses)))
+        self.__pending.difference_update(misses)
+        return [cache[key] for key in keys]
 
 
 T = TypeVar("T")
@@ -13,17 +13,21 @@ class QueryInstanceGroupLoader(QueryInterface[TElt], Generic[TKey, TElt]):
     a list of keys and returns a list of items for each key.
     """
 
+    __slots__ = ("__load_fn", "__key_fn", "__sort_fn", "__dl")
+
     def __init__(
         self,
         load_fn: Callable[[list[TKey]], Awaitable[list[TElt]]],
         key_fn: Callable[[TElt], TKey],
         sort_fn: Callable[[TElt], Scalar],
+        *,
+        max_batch_size: int | None = None,
     ) -> None:
         self.__load_fn = load_fn
         self.__key_fn = key_fn
         self.__sort_fn = sort_fn
         self.__dl: strawberry.dataloader.DataLoader[TKey, list[TElt]] = (
-            strawberry.dataloader.DataLoader(self.__load)
+            strawberry.dataloader.DataLoader(self.__load, max_batch_size=max_batch_size)
         )
 
     async def __load(self, keys: list[TKey]) -> list[list[TElt]]:
@@ -5,6 +5,8 @@ from tadl.types import TElt
 
 
 class QueryInterface(abc.ABC, Generic[TElt]):
+    __slots__ = ()
+
     @abc.abstractmethod
     def prime_many(self, elts: list[TElt]) -> None:
         pass
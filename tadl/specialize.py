@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import inspect
+import operator
+from typing import Callable, TypeVar, cast
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class _Accessible:
+    attribute: object
+
+    def __getitem__(self, item: str) -> object: ...
+
+
+# Reference functions for the accessor shapes that can be specialized.
+# Any function whose bytecode is identical to one of these (the attribute names
+# and constants live outside of the bytecode) behaves the same way.
+def _attribute_template(value: _Accessible) -> object:
+    return value.attribute
+
+
+def _subscript_template(value: _Accessible) -> object:
+    return value["subscript"]
+
+
+_ATTRIBUTE_CODE = _attribute_template.__code__.co_code
+_SUBSCRIPT_CODE = _subscript_template.__code__.co_code
+_SUBSCRIPT_CONST_INDEX = cast(
+    tuple[object, ...], _subscript_template.__code__.co_consts
+).index("subscript")
+
+# Functions with any of these flags can't be simple accessors.
+_UNSUPPORTED_FLAGS = (
+    inspect.CO_VARARGS
+    | inspect.CO_VARKEYWORDS
+    | inspect.CO_GENERATOR
+    | inspect.CO_COROUTINE
+    | inspect.CO_ASYNC_GENERATOR
+)
+
+
+def specialize_callable(fn: Callable[[T], R]) -> Callable[[T], R]:
+    """
+    Replace a simple accessor function with an equivalent (C-implemented)
+    callable from the ``operator`` module.
+
+    Key and sort functions are called once for every element that passes
+    through a loader, and they're usually trivial lambdas. This recognizes
+    the two most common shapes and swaps them out:
+
+        lambda x: x.attr    ->  operator.attrgetter("attr")
+        lambda x: x["key"]  ->  operator.itemgetter("key")
+
+    Any other callable is returned unchanged.
+    """
+    if not inspect.isfunction(fn):
+        return fn
+    code = fn.__code__
+    if (
+        code.co_argcount != 1
+        or code.co_kwonlyargcount
+        or code.co_flags & _UNSUPPORTED_FLAGS
+    ):
+        return fn
+    if code.co_code == _ATTRIBUTE_CODE:
+        return cast(Callable[[T], R], operator.attrgetter(code.co_names[0]))
+    if code.co_code == _SUBSCRIPT_CODE:
+        consts = cast(tuple[object, ...], code.co_consts)
+        return cast(
+            Callable[[T], R], operator.itemgetter(consts[_SUBSCRIPT_CONST_INDEX])
+        )
+    return fn
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+import tadl
+
+pytestmark = pytest.mark.asyncio
+
+
+async def test_batch_loader_max_batch_size() -> None:
+    class SquareService:
+        def __init__(self) -> None:
+            self.batches = list[list[int]]()
+
+        @tadl.batch_loader(max_batch_size=2)
+        async def square(self, keys: list[int]) -> list[int]:
+            self.batches.append(keys)
+            return [key * key for key in keys]
+
+    svc = SquareService()
+    assert await asyncio.gather(*(svc.square(i) for i in range(5))) == [
+        0,
+        1,
+        4,
+        9,
+        16,
+    ]
+    assert svc.batches == [[0, 1], [2, 3], [4]]
+
+
+async def test_query_interfaces_max_batch_size() -> None:
+    class NumberService:
+        def __init__(self) -> None:
+            self.batches = list[list[int]]()
+
+        @tadl.query
+        async def __query(self, keys: list[int]) -> list[int]:
+            self.batches.append(keys)
+            return keys
+
+        @__query.batch_interface(key=lambda n: n, max_batch_size=2)
+        async def by_value(self, keys: list[int]) -> list[int]:
+            return await self.__query(keys)
+
+        @__query.group_interface(key=lambda n: n, sort=lambda n: n, max_batch_size=2)
+        async def for_value(self, keys: list[int]) -> list[int]:
+            return await self.__query(keys)
+
+    svc = NumberService()
+    assert await svc.by_value.load_many([0, 1, 2, 3, 4]) == [0, 1, 2, 3, 4]
+    assert svc.batches == [[0, 1], [2, 3], [4]]
+
+    svc.batches.clear()
+    assert await svc.for_value.load_many([5, 6, 7, 8, 9]) == [[5], [6], [7], [8], [9]]
+    assert svc.batches == [[5, 6], [7, 8], [9]]
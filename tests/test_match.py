@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import dataclasses
+
+from tadl import group_array, match_array
+
+
+def test_match_array() -> None:
+    assert match_array([1, 2, 3], [6, 4], key=lambda x: x // 2) == [None, 4, 6]
+
+
+def test_group_array() -> None:
+    values = [(1, "one"), (2, "two"), (1, "uno"), (2, "dos"), (3, "three")]
+    assert group_array(
+        [1, 2, 3, 4],
+        values,
+        key=lambda x: x[0],
+        sort=lambda x: x[1],
+    ) == [[(1, "one"), (1, "uno")], [(2, "dos"), (2, "two")], [(3, "three")], []]
+
+
+def test_group_array_unorderable_values() -> None:
+    """
+    Values with equal sort keys must not be compared to each other and should
+    retain their input order.
+    """
+
+    @dataclasses.dataclass
+    class Item:
+        group: int
+        rank: int
+        name: str
+
+    a = Item(group=1, rank=0, name="a")
+    b = Item(group=1, rank=0, name="b")
+    c = Item(group=1, rank=-1, name="c")
+    assert group_array(
+        [1],
+        [a, b, c],
+        key=lambda item: item.group,
+        sort=lambda item: item.rank,
+    ) == [[c, a, b]]
+
+
+def test_match_array_in_key_order() -> None:
+    assert match_array([1, 2, 3], [2, 4, 6], key=lambda x: x // 2) == [2, 4, 6]
+    assert match_array((1, 2, 3), (2, 4, 6), key=lambda x: x // 2) == [2, 4, 6]
+
+
+def test_match_array_out_of_key_order() -> None:
+    assert match_array([1, 2], [4, 2], key=lambda x: x // 2) == [2, 4]
+
+
+def test_match_array_repeated_keys() -> None:
+    """
+    The last value for a key wins, even if the values are in key order.
+    """
+    assert match_array([1, 1], ["a", "b"], key=lambda x: 1) == ["b", "b"]
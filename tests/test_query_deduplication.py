@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+import asyncio
 import dataclasses
-from typing import Callable, reveal_type
+from typing import Callable, NoReturn, cast, reveal_type
 
 import pytest
 
 import tadl
+from tadl.query import Query
 
 pytestmark = pytest.mark.asyncio
 
@@ -48,9 +50,138 @@ async def test_example_page_service() -> None:
     ), "for_user should not trigger new queries when given seen user_ids"
 
 
+async def test_interfaces_are_shared_with_query() -> None:
+    ps = PageService()
+    ps.add_page(Page(id=1, slug="a", user_id=1))
+
+    # Initialize the by_id interface before the query has been accessed.
+    by_id = ps.by_id
+
+    page = await ps.by_slug.load("a")
+    assert ps.by_id is by_id, "the query should reuse initialized interfaces"
+    assert await by_id.load(1) is page
+    assert ps.query_count == 1
+
+
+async def test_query_instance_is_memoized(monkeypatch: pytest.MonkeyPatch) -> None:
+    class NumberService:
+        @tadl.query
+        async def numbers(self) -> list[int]:
+            return [1, 2, 3]
+
+    get = cast(Callable[[object, object, type], object], Query.__get__)
+    get_calls = list[object]()
+
+    def counting_get(self: object, instance: object, owner: type) -> object:
+        get_calls.append(instance)
+        return get(self, instance, owner)
+
+    monkeypatch.setattr(Query, "__get__", counting_get)
+
+    svc = NumberService()
+    query_instance = svc.numbers
+    assert svc.numbers is query_instance
+    assert await svc.numbers() == [1, 2, 3]
+    assert get_calls == [svc], "Query.__get__ should only run on first access"
+
+
+async def test_prime_does_not_overwrite_loaded_value() -> None:
+    ps = PageService()
+    page = Page(id=1, slug="a", user_id=1)
+    ps.add_page(page)
+    assert await ps.by_id.load(1) is page
+
+    # A second copy of the page (with the same id) is returned by a later query
+    # and primed into by_id, which must keep the value it already loaded.
+    ps.add_page(Page(id=1, slug="z", user_id=1))
+    await ps.by_slug.load("z")
+    assert await ps.by_id.load(1) is page
+    assert (await ps.by_id.load_many([1]))[0] is page
+
+
+async def test_prime_does_not_overwrite_pending_load() -> None:
+    """
+    A value primed while a load for the same key is in flight must not replace
+    the value that the load resolves to (matching the DataLoader).
+    """
+
+    class SlowPageService:
+        def __init__(self) -> None:
+            self.pages = [Page(id=1, slug="old", user_id=1)]
+            self.started = asyncio.Event()
+            self.release = asyncio.Event()
+
+        @tadl.query
+        async def __query(self, pages: list[Page]) -> list[Page]:
+            return pages
+
+        @__query.batch_interface(key=lambda page: page.id)
+        async def by_id(self, ids: list[int]) -> list[Page]:
+            # Read the rows, then stall before returning them (so that the
+            # result is older than anything primed in the meantime).
+            pages = [page for page in self.pages if page.id in ids]
+            self.started.set()
+            await self.release.wait()
+            return await self.__query(pages)
+
+        @__query.batch_interface(key=lambda page: page.slug)
+        async def by_slug(self, slugs: list[str]) -> list[Page]:
+            return await self.__query(
+                [page for page in self.pages if page.slug in slugs]
+            )
+
+    svc = SlowPageService()
+    old = svc.pages[0]
+    first = asyncio.create_task(svc.by_id.load(1))
+    await svc.started.wait()
+
+    # A newer version of the row is returned by another query (which primes
+    # by_id) while the first load is still in flight.
+    svc.pages = [Page(id=1, slug="new", user_id=1)]
+    await svc.by_slug.load("new")
+    second = asyncio.create_task(svc.by_id.load(1))
+
+    svc.release.set()
+    assert await first is old
+    assert await second is old
+    assert await svc.by_id.load(1) is old
+    assert await svc.by_id.load_many([1]) == [old]
+
+
+async def test_load_many_only_loads_misses() -> None:
+    ps = PageService()
+    for i in range(1, 4):
+        ps.add_page(Page(id=i, slug=str(i), user_id=1))
+
+    await ps.by_id.load(1)
+    assert ps.by_id_calls == [[1]]
+
+    pages = await ps.by_id.load_many([2, 1, 3, 1, 2])
+    assert [page.id if page else None for page in pages] == [2, 1, 3, 1, 2]
+    assert ps.by_id_calls == [[1], [2, 3]], "only the misses should be loaded"
+
+
+async def test_primed_load_skips_dataloader(monkeypatch: pytest.MonkeyPatch) -> None:
+    ps = PageService()
+    page = Page(id=1, slug="a", user_id=1)
+    ps.add_page(page)
+    await ps.by_slug.load("a")
+
+    def fail(*args: object, **kwargs: object) -> NoReturn:
+        raise AssertionError("primed keys should not reach the DataLoader")
+
+    monkeypatch.setattr("strawberry.dataloader.DataLoader.load", fail)
+    monkeypatch.setattr("strawberry.dataloader.DataLoader.load_many", fail)
+    assert await ps.by_id.load(1) is page
+    assert await ps.by_id(1) is page
+    assert await ps.by_id.load_many([1, 1]) == [page, page]
+    assert ps.by_id_calls == []
+
+
 class PageService:
     def __init__(self) -> None:
         self.query_count = 0
+        self.by_id_calls = list[list[int]]()
         self.__data = list[Page]()
 
     def add_page(self, page: Page) -> None:
@@ -63,6 +194,7 @@ class PageService:
 
     @__query.batch_interface(key=lambda page: page.id)
     async def by_id(self, ids: list[int]) -> list[Page]:
+        self.by_id_calls.append(ids)
         return await self.__query(lambda page: page.id in ids)
 
     @__query.batch_interface(key=lambda page: page.slug)
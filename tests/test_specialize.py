@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import dataclasses
+import inspect
+from typing import Callable
+
+from tadl.specialize import specialize_callable
+
+
+@dataclasses.dataclass
+class Item:
+    id: int
+    name: str
+
+
+def test_specialize_attribute_access() -> None:
+    key: Callable[[Item], int] = lambda item: item.id
+    fn = specialize_callable(key)
+    assert not inspect.isfunction(fn)
+    assert fn(Item(id=1, name="a")) == 1
+
+
+def test_specialize_subscript() -> None:
+    key: Callable[[dict[str, str]], str] = lambda data: data["key"]
+    fn = specialize_callable(key)
+    assert not inspect.isfunction(fn)
+    assert fn({"key": "value"}) == "value"
+
+
+def test_specialize_unchanged() -> None:
+    offset = 1
+
+    def identity(item: Item) -> Item:
+        return item
+
+    fns: list[Callable[[Item], object]] = [
+        lambda item: item.id + 1,
+        lambda item: item.id.bit_length(),
+        lambda item: item.name[offset],
+        lambda item: (item.id, item.name),
+        identity,
+        repr,
+    ]
+    for fn in fns:
+        assert specialize_callable(fn) is fn